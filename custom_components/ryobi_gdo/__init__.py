@@ -3,17 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import Config, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import COORDINATOR, DOMAIN, ISSUE_URL, PLATFORMS, VERSION
+from .const import COORDINATOR, DOMAIN, ISSUE_URL, LOGGER, PLATFORMS, VERSION
 from .coordinator import RyobiDataUpdateCoordinator
 
-LOGGER = logging.getLogger(__name__)
-
 
 async def async_setup(  # pylint: disable-next=unused-argument
     hass: HomeAssistant, config: Config
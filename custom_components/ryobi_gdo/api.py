@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import asyncio
 from collections import abc
+import functools
 import json
 import logging
+import random
+import time
 
 import aiohttp  # type: ignore
 from aiohttp.client_exceptions import ServerConnectionError, ServerTimeoutError
@@ -23,19 +26,35 @@ from .const import (
     DEVICE_SET_ENDPOINT,
     GARAGE_UPDATE_MSG,
     HOST_URI,
+    LOGGER,
     LOGIN_ENDPOINT,
     WS_AUTH_OK,
     WS_CMD_ACK,
     WS_OK,
 )
 
-LOGGER = logging.getLogger(__name__)
+try:
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as json_loads
+except ImportError:  # orjson ships with Home Assistant, keep stdlib as fallback
+    # Compact output like orjson, the default separators pad every item
+    json_dumps = functools.partial(
+        json.dumps, separators=(",", ":"), ensure_ascii=False
+    )
+    json_loads = json.loads
+else:
+
+    def json_dumps(obj) -> str:
+        """Serialize obj to a JSON formatted str."""
+        return _orjson_dumps(obj).decode()
+
 
 METHOD = "method"
 PARAMS = "params"
 RESULT = "result"
 
 MAX_FAILED_ATTEMPTS = 5
+MAX_QUEUED_MESSAGES = 64
 INFO_LOOP_RUNNING = "Event loop already running, not creating new one."
 
 # Websocket errors
@@ -62,7 +81,13 @@ class RyobiApiClient:
         "4": "fault",
     }
 
-    def __init__(self, username: str, password: str, device_id: str | None = None):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        device_id: str | None = None,
+        session: aiohttp.ClientSession | None = None,
+    ):
         """Initialize the API object."""
         self.username = username
         self.password = password
@@ -76,34 +101,52 @@ class RyobiApiClient:
         self.callback: abc.Callable | None = None
         self.socket_state = None
         self.ws_listening = False
+        self._listen_task: asyncio.Task | None = None
         self._modules = {}
+        self._session = session
 
     async def _process_request(
         self, url: str, method: str, data: dict[str, str]
     ) -> dict | None:
         """Process HTTP requests."""
+        if self._session is not None:
+            return await self._send_request(self._session, url, method, data)
         async with aiohttp.ClientSession() as session:
-            http_hethod = getattr(session, method)
-            LOGGER.debug("Connecting to %s using %s", url, method)
-            reply = None
-            try:
-                async with http_hethod(url, data=data) as response:
-                    rawReply = await response.text()
-                    try:
-                        reply = json.loads(rawReply)
-                        if not isinstance(reply, dict):
-                            reply = None
-                    except ValueError:
-                        LOGGER.warning("Reply was not in JSON format: %s", rawReply)
-
-                    if response.status in [404, 405, 500]:
-                        LOGGER.warning("HTTP Error: %s", rawReply)
-            except (TimeoutError, ServerTimeoutError):
-                LOGGER.error("Timeout connecting to %s", url)
-            except ServerConnectionError:
-                LOGGER.error("Problem connecting to server at %s", url)
-            await session.close()
-            return reply
+            return await self._send_request(session, url, method, data)
+
+    async def _send_request(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        method: str,
+        data: dict[str, str],
+    ) -> dict | None:
+        """Send HTTP request using the given session."""
+        http_hethod = getattr(session, method)
+        LOGGER.debug("Connecting to %s using %s", url, method)
+        reply = None
+        try:
+            async with http_hethod(url, data=data) as response:
+                # Decode straight from the body bytes, skipping the
+                # intermediate str copy of the full reply
+                rawReply = await response.read()
+                try:
+                    reply = json.loads(rawReply)
+                    if not isinstance(reply, dict):
+                        reply = None
+                except ValueError:
+                    LOGGER.warning(
+                        "Reply was not in JSON format: %s",
+                        rawReply.decode(errors="replace"),
+                    )
+
+                if response.status in [404, 405, 500]:
+                    LOGGER.warning("HTTP Error: %s", rawReply.decode(errors="replace"))
+        except (TimeoutError, ServerTimeoutError):
+            LOGGER.error("Timeout connecting to %s", url)
+        except ServerConnectionError:
+            LOGGER.error("Problem connecting to server at %s", url)
+        return reply
 
     async def get_api_key(self) -> bool:
         """Get api_key from Ryobi."""
@@ -122,46 +165,31 @@ class RyobiApiClient:
             LOGGER.error("Exception while parsing Ryobi answer to get API key")
         return auth_ok
 
-    async def check_device_id(self) -> bool:
-        """Check device_id from Ryobi."""
-        device_found = False
+    async def _get_device_list(self) -> list:
+        """Return the raw device list for the account."""
         url = f"https://{HOST_URI}/{DEVICE_GET_ENDPOINT}"
         data = {"username": self.username, "password": self.password}
         method = "get"
         request = await self._process_request(url, method, data)
         if request is None:
-            return device_found
+            return []
         try:
             result = request["result"]
         except KeyError:
-            return device_found
+            return []
         if len(result) == 0:
             LOGGER.error("API error: empty result")
-        else:
-            for data in result:
-                if data["varName"] == self.device_id:
-                    device_found = True
-        return device_found
+        return result
+
+    async def check_device_id(self) -> bool:
+        """Check device_id from Ryobi."""
+        result = await self._get_device_list()
+        return any(data["varName"] == self.device_id for data in result)
 
-    async def get_devices(self) -> list:
+    async def get_devices(self) -> dict:
         """Return list of devices found."""
-        devices = {}
-        url = f"https://{HOST_URI}/{DEVICE_GET_ENDPOINT}"
-        data = {"username": self.username, "password": self.password}
-        method = "get"
-        request = await self._process_request(url, method, data)
-        if request is None:
-            return devices
-        try:
-            result = request["result"]
-        except KeyError:
-            return devices
-        if len(result) == 0:
-            LOGGER.error("API error: empty result")
-        else:
-            for data in result:
-                devices[data["varName"]] = data["metaData"]["name"]
-        return devices
+        result = await self._get_device_list()
+        return {data["varName"]: data["metaData"]["name"] for data in result}
 
     async def update(self) -> bool:
         """Update door status from Ryobi."""
@@ -171,8 +199,8 @@ class RyobiApiClient:
                 LOGGER.error("Problem refreshing API key.")
                 return False
 
-        # Reconnect logic
-        if self.ws and not self.ws_listening:
+        # Reconnect logic, only when no listener is left to do it
+        if self.ws and not self.ws_listening and not self.ws_running:
             self.ws_connect()
 
         update_ok = False
@@ -183,7 +211,8 @@ class RyobiApiClient:
         if request is None:
             return update_ok
         try:
-            dtm = request["result"][0]["deviceTypeMap"]
+            device = request["result"][0]
+            dtm = device["deviceTypeMap"]
             # Parse the modules
             result = await self._index_modules(dtm)
 
@@ -191,61 +220,54 @@ class RyobiApiClient:
 
             # Parse initial values while we setup the websocket for push updates
             if result:
-                if "garageDoor" in self._modules:
-                    door_state = dtm[self._modules["garageDoor"]]["at"]["doorState"][
+                # Resolve each module's attribute map once instead of
+                # re-walking the device type map for every value
+                attrs = {
+                    module: dtm[key]["at"] for module, key in self._modules.items()
+                }
+                if "garageDoor" in attrs:
+                    door = attrs["garageDoor"]
+                    door_state = door["doorState"]["value"]
+                    self._data["door_state"] = self.DOOR_STATE[str(door_state)]
+                    self._data["saftey"] = door["sensorFlag"]["value"]
+                    self._data["vacationMode"] = door["vacationMode"]["value"]
+                    if "motionSensor" in door:
+                        self._data["motion"] = door["motionSensor"]["value"]
+                if "garageLight" in attrs:
+                    self._data["light_state"] = attrs["garageLight"]["lightState"][
                         "value"
                     ]
-                    self._data["door_state"] = self.DOOR_STATE[str(door_state)]
-                    self._data["saftey"] = dtm[self._modules["garageDoor"]]["at"][
-                        "sensorFlag"
-                    ]["value"]
-                    self._data["vacationMode"] = dtm[self._modules["garageDoor"]]["at"][
-                        "vacationMode"
+                if "backupCharger" in attrs:
+                    self._data["battery_level"] = attrs["backupCharger"][
+                        "chargeLevel"
                     ]["value"]
-                    if "motionSensor" in dtm[self._modules["garageDoor"]]["at"]:
-                        self._data["motion"] = dtm[self._modules["garageDoor"]]["at"][
-                            "motionSensor"
-                        ]["value"]
-                if "garageLight" in self._modules:
-                    self._data["light_state"] = dtm[self._modules["garageLight"]]["at"][
-                        "lightState"
-                    ]["value"]
-                if "backupCharger" in self._modules:
-                    self._data["battery_level"] = dtm[self._modules["backupCharger"]][
-                        "at"
-                    ]["chargeLevel"]["value"]
-                if "wifiModule" in self._modules:
-                    self._data["wifi_rssi"] = dtm[self._modules["wifiModule"]]["at"][
-                        "rssi"
-                    ]["value"]
-                if "parkAssistLaser" in self._modules:
-                    self._data["park_assist"] = dtm[self._modules["parkAssistLaser"]][
-                        "at"
-                    ]["moduleState"]["value"]
-                if "inflator" in self._modules:
-                    self._data["inflator"] = dtm[self._modules["inflator"]]["at"][
+                if "wifiModule" in attrs:
+                    self._data["wifi_rssi"] = attrs["wifiModule"]["rssi"]["value"]
+                if "parkAssistLaser" in attrs:
+                    self._data["park_assist"] = attrs["parkAssistLaser"][
                         "moduleState"
                     ]["value"]
-                if "btSpeaker" in self._modules:
-                    self._data["bt_speaker"] = dtm[self._modules["btSpeaker"]]["at"][
-                        "moduleState"
-                    ]["value"]
-                    self._data["micStatus"] = dtm[self._modules["btSpeaker"]]["at"][
-                        "micEnable"
-                    ]["value"]
-                if "fan" in self._modules:
-                    self._data["fan"] = dtm[self._modules["fan"]]["at"]["speed"][
-                        "value"
-                    ]
-
-            if "name" in request["result"][0]["metaData"]:
-                self._data["device_name"] = request["result"][0]["metaData"]["name"]
+                if "inflator" in attrs:
+                    self._data["inflator"] = attrs["inflator"]["moduleState"]["value"]
+                if "btSpeaker" in attrs:
+                    speaker = attrs["btSpeaker"]
+                    self._data["bt_speaker"] = speaker["moduleState"]["value"]
+                    self._data["micStatus"] = speaker["micEnable"]["value"]
+                if "fan" in attrs:
+                    self._data["fan"] = attrs["fan"]["speed"]["value"]
+
+            if "name" in device["metaData"]:
+                self._data["device_name"] = device["metaData"]["name"]
             update_ok = True
             LOGGER.debug("Data: %s", self._data)
             if not self.ws:
                 # Start websocket listening
                 self.ws = RyobiWebSocket(
-                    self._process_message, self.username, self.api_key, self.device_id
+                    self._process_message,
+                    self.username,
+                    self.api_key,
+                    self.device_id,
+                    session=self._session,
                 )
         except KeyError as error:
             LOGGER.error("Exception while parsing answer to update device: %s", error)
@@ -304,10 +326,26 @@ class RyobiApiClient:
         if self.ws_listening:
             LOGGER.debug("Websocket already connected.")
             return
+        if self.ws_running:
+            # The listener is starting or backing off, it reconnects itself
+            LOGGER.debug("Websocket listener already running.")
+            return
+
+        if self.ws.state == STATE_STOPPED:
+            if self.ws.closed:
+                LOGGER.debug("Websocket was closed, not reconnecting.")
+                return
+            # The previous listener gave up after errors, start over
+            self.ws.reset()
 
         LOGGER.debug("Websocket not connected, connecting now...")
         self.open_websocket()
 
+    @property
+    def ws_running(self) -> bool:
+        """Return True if a websocket listener task is running."""
+        return self._listen_task is not None and not self._listen_task.done()
+
     async def ws_disconnect(self) -> bool:
         """Disconnect from websocket."""
         assert self.ws
@@ -325,7 +363,7 @@ class RyobiApiClient:
             LOGGER.debug("Using new event loop...")
 
         if not self.ws_listening:
-            self._loop.create_task(self.ws.listen())
+            self._listen_task = self._loop.create_task(self.ws.listen())
             pending = asyncio.all_tasks()
             try:
                 self._loop.run_until_complete(asyncio.gather(*pending))
@@ -337,10 +375,12 @@ class RyobiApiClient:
         self, msg_type: str, msg: dict, error: str | None = None
     ) -> None:
         """Process websocket data and handle websocket signaling."""
-        LOGGER.debug(
-            "Websocket callback msg_type: %s msg: %s err: %s", msg_type, msg, error
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Websocket callback msg_type: %s msg: %r err: %s", msg_type, msg, error
+            )
         if msg_type == SIGNAL_CONNECTION_STATE:
+            was_listening = self.ws_listening
             self.ws_listening = False
             if msg == STATE_CONNECTED:
                 LOGGER.debug("Websocket to %s successful", self.ws.url)
@@ -363,18 +403,25 @@ class RyobiApiClient:
             else:
                 LOGGER.debug("Websocket state: %s error: %s", msg, error)
 
+            # Let listeners pick up the connection change
+            if self.ws_listening != was_listening and self.callback is not None:
+                self.callback()
+
         elif msg_type == "data":
             message = msg
-            LOGGER.debug("Websocket data: %s", message)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Websocket data: %r", message)
 
-            if METHOD in message:
-                if message[METHOD] == GARAGE_UPDATE_MSG:
+            method = message.get(METHOD)
+            if method is not None:
+                params = message.get(PARAMS)
+                if method == GARAGE_UPDATE_MSG:
                     LOGGER.debug("Websocket update message.")
-                    if PARAMS in message:
-                        await self.parse_message(message[PARAMS])
+                    if params is not None:
+                        await self.parse_message(params)
 
-                elif message[METHOD] == WS_AUTH_OK:
-                    if message[PARAMS]["authorized"]:
+                elif method == WS_AUTH_OK:
+                    if params["authorized"]:
                         LOGGER.debug("Websocket API key authorized.")
                     else:
                         LOGGER.error("Websocket API key not authorized.")
@@ -402,11 +449,13 @@ class RyobiApiClient:
             )
             return None
 
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
         for key in data:
             if key in ["topic", "varName", "id"]:
                 continue
 
-            LOGGER.debug("Websocket parsing update for item %s: %s", key, data[key])
+            if debug:
+                LOGGER.debug("Websocket parsing update for item %s: %r", key, data[key])
 
             module_name = key.split(".")[1]
 
@@ -459,33 +508,73 @@ class RyobiApiClient:
                 LOGGER.error("Websocket data update unknown module: %s", key)
 
         if self.callback is not None:
-            await self.callback()
+            self.callback()
 
 
 class RyobiWebSocket:
     """Represent a websocket connection to Ryobi servers."""
 
-    def __init__(self, callback, username: str, apikey: str, device: str) -> None:
+    def __init__(
+        self,
+        callback,
+        username: str,
+        apikey: str,
+        device: str,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
         """Initialize a RyobiWebSocket instance."""
-        self.session = aiohttp.ClientSession()
+        self.session = session if session is not None else aiohttp.ClientSession()
         self.url = f"wss://{HOST_URI}/{DEVICE_SET_ENDPOINT}"
         self._user = username
         self._apikey = apikey
         self._device_id = device
         self.callback: abc.Callable = callback
         self._state = None
+        self._closed = False
         self._error_reason = None
         self._ws_client = None
         self.failed_attempts = 0
+        self.last_msg: float | None = None
+        # Bounded so a slow callback stops the reader instead of piling up
+        # parsed messages
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_MESSAGES)
+        # Command envelope reused by send_message, only the command fields
+        # change between calls
+        self._cmd_template = {
+            "jsonrpc": "2.0",
+            "method": "gdoModuleCommand",
+            "params": {"msgType": 16, "topic": device},
+        }
+        self._handlers: dict[aiohttp.WSMsgType, abc.Callable] = {
+            aiohttp.WSMsgType.TEXT: self._on_text,
+            aiohttp.WSMsgType.CLOSED: self._on_closed,
+            aiohttp.WSMsgType.ERROR: self._on_error,
+        }
+        # Credentials and device never change, serialize the handshake once
+        self._auth_frame = json_dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "srvWebSocketAuth",
+                "params": {"varName": username, "apiKey": apikey},
+            }
+        )
+        self._subscribe_frame = json_dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": 3,
+                "method": "wskSubscribe",
+                "params": {"topic": device + ".wskAttributeUpdateNtfy"},
+            }
+        )
 
     @property
     def state(self) -> str | None:
         """Return the current state."""
         return self._state
 
-    @state.setter
-    async def state(self, value) -> None:
-        """Set the state."""
+    async def _set_state(self, value: str) -> None:
+        """Set the state and signal the change."""
         self._state = value
         LOGGER.debug("Websocket state: %s", value)
         await self.callback(SIGNAL_CONNECTION_STATE, value, self._error_reason)
@@ -493,43 +582,51 @@ class RyobiWebSocket:
 
     async def running(self):
         """Open a persistent websocket connection and act on events."""
-        await RyobiWebSocket.state.fset(self, STATE_STARTING)
+        await self._set_state(STATE_STARTING)
 
         header = {"Connection": "keep-alive, Upgrade", "handshakeTimeout": "10000"}
 
         try:
             async with self.session.ws_connect(
                 self.url,
-                heartbeat=15,
+                # Ping every 30s: enough to keep NAT/proxies from dropping an
+                # idle link at half the wakeups, while receive_timeout stays
+                # the real liveness guard
+                heartbeat=30,
                 headers=header,
-                receive_timeout=5*60, #Should see something from Ryobi about every 5 Minutes
+                receive_timeout=5 * 60,  # Ryobi sends something about every 5 minutes
             ) as ws_client:
                 self._ws_client = ws_client
 
                 # Auth to server and subscribe to topic
-                if self._state != STATE_CONNECTED:
-                    await self.websocket_auth()
-                    await asyncio.sleep(0.5)
-                    await self.websocket_subscribe()
-
-                await RyobiWebSocket.state.fset(self, STATE_CONNECTED)
+                if not await self.websocket_auth():
+                    # Let the usual backoff handle the retry
+                    raise aiohttp.ClientConnectionError(
+                        "Websocket closed during authentication"
+                    )
+                await self.websocket_subscribe()
+
+                await self._set_state(STATE_CONNECTED)
                 self.failed_attempts = 0
 
-                async for message in ws_client:
-                    if self._state == STATE_STOPPED:
-                        break
-
-                    if message.type == aiohttp.WSMsgType.TEXT:
-                        msg = message.json()
-                        await self.callback("data", msg)
-
-                    elif message.type == aiohttp.WSMsgType.CLOSED:
-                        LOGGER.warning("Websocket connection closed")
-                        break
-
-                    elif message.type == aiohttp.WSMsgType.ERROR:
-                        LOGGER.error("Websocket error")
-                        break
+                consumer = asyncio.create_task(self._consume())
+                handlers = self._handlers
+                try:
+                    async for message in ws_client:
+                        if self._state == STATE_STOPPED:
+                            break
+
+                        handler = handlers.get(message.type)
+                        if handler is None:
+                            continue
+                        if await handler(message) is False:
+                            break
+                finally:
+                    consumer.cancel()
+                    # Frames left from this connection would be stale by the
+                    # time the next one is up
+                    while not self._queue.empty():
+                        self._queue.get_nowait()
 
         except aiohttp.ClientResponseError as error:
             if error.status == 401:
@@ -538,73 +635,136 @@ class RyobiWebSocket:
             else:
                 LOGGER.error("Unexpected response received: %s", error)
                 self._error_reason = ERROR_UNKNOWN
-            await RyobiWebSocket.state.fset(self, STATE_STOPPED)
+            await self._set_state(STATE_STOPPED)
         except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
             if self.failed_attempts >= MAX_FAILED_ATTEMPTS:
                 self._error_reason = ERROR_TOO_MANY_RETRIES
-                await RyobiWebSocket.state.fset(self, STATE_STOPPED)
+                await self._set_state(STATE_STOPPED)
             elif self._state != STATE_STOPPED:
-                retry_delay = min(2 ** (self.failed_attempts - 1) * 30, 300)
+                # Jitter the backoff so clients dropped together don't all
+                # reconnect at the same moment
+                backoff = min(2 ** (self.failed_attempts - 1) * 30, 300)
+                retry_delay = random.uniform(backoff * 0.5, backoff)
                 self.failed_attempts += 1
                 LOGGER.error(
-                    "Websocket connection failed, retrying in %ds: %s",
+                    "Websocket connection failed, retrying in %.0fs: %s",
                     retry_delay,
                     error,
                 )
-                await RyobiWebSocket.state.fset(self, STATE_DISCONNECTED)
+                await self._set_state(STATE_DISCONNECTED)
                 await asyncio.sleep(retry_delay)
         except Exception as error:  # pylint: disable=broad-except
             if self._state != STATE_STOPPED:
                 LOGGER.exception("Unexpected exception occurred: %s", error)
                 self._error_reason = ERROR_UNKNOWN
-                await RyobiWebSocket.state.fset(self, STATE_STOPPED)
+                await self._set_state(STATE_STOPPED)
         else:
             if self._state != STATE_STOPPED:
                 LOGGER.debug(
-                    "Websocket msgType: %s CloseCode: %s",
-                    str(aiohttp.WSMsgType.name),
-                    str(aiohttp.WSCloseCode.name),
+                    "Websocket closed with code: %s", self._ws_client.close_code
                 )
-                await RyobiWebSocket.state.fset(self, STATE_DISCONNECTED)
+                await self._set_state(STATE_DISCONNECTED)
                 await asyncio.sleep(5)
 
+    async def _on_text(self, message: aiohttp.WSMessage) -> None:
+        """Handle a text frame."""
+        self.last_msg = time.time()
+        # Nobody will consume it, don't pay for parsing
+        if self._state == STATE_STOPPED or self.callback is None:
+            return
+        await self._queue.put(json_loads(message.data))
+
+    async def _consume(self) -> None:
+        """Hand queued messages to the callback."""
+        while True:
+            await self._dispatch(await self._queue.get())
+
+    async def _dispatch(self, msg: dict) -> None:
+        """Hand a message to the callback without letting it end the listener."""
+        try:
+            await self.callback("data", msg)
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Error processing websocket message: %s", msg)
+
+    async def _on_closed(self, message: aiohttp.WSMessage) -> bool:
+        """Handle the connection closing, stop reading."""
+        LOGGER.warning("Websocket connection closed")
+        return False
+
+    async def _on_error(self, message: aiohttp.WSMessage) -> bool:
+        """Handle a connection error, stop reading."""
+        LOGGER.error("Websocket error")
+        return False
+
     async def listen(self):
         """Start the listening websocket."""
         self.failed_attempts = 0
         while self._state != STATE_STOPPED:
             await self.running()
 
+    @property
+    def closed(self) -> bool:
+        """Return True if the websocket was closed on request."""
+        return self._closed
+
+    def reset(self) -> None:
+        """Clear a stop caused by errors so the listener can run again."""
+        self._state = None
+        self._error_reason = None
+        self.failed_attempts = 0
+
     async def close(self):
         """Close the listening websocket."""
-        await RyobiWebSocket.state.fset(self, STATE_STOPPED)
+        self._closed = True
+        await self._set_state(STATE_STOPPED)
+        # Closing the client ends the receive loop now rather than when the
+        # next message or the receive timeout arrives
+        if self._ws_client is not None and not self._ws_client.closed:
+            await self._ws_client.close(code=aiohttp.WSCloseCode.GOING_AWAY)
+
+    async def websocket_auth(self) -> bool:
+        """Authenticate with Ryobi server, return False if the link went down."""
+        LOGGER.debug(
+            "Websocket attempting authenticate with server for %s", self._device_id
+        )
+        if not await self._send_frame(self._auth_frame):
+            return False
 
-    async def websocket_auth(self) -> None:
-        """Authenticate with Ryobi server."""
-        LOGGER.debug("Websocket attempting authenticate with server.")
-        auth_request = {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "method": "srvWebSocketAuth",
-            "params": {"varName": self._user, "apiKey": self._apikey},
-        }
-        await self.websocket_send(auth_request)
+        # Wait for the server to answer the auth request before subscribing
+        try:
+            reply = await self._ws_client.receive(timeout=5)
+        except asyncio.TimeoutError:
+            LOGGER.warning("Websocket no reply to authentication request.")
+            return True
+        if reply.type != aiohttp.WSMsgType.TEXT:
+            LOGGER.warning("Websocket closed while authenticating: %s", reply.type)
+            return False
+        self.last_msg = time.time()
+        try:
+            msg = json_loads(reply.data)
+        except ValueError:
+            LOGGER.error("Websocket invalid authentication reply: %s", reply.data)
+            return True
+        await self._dispatch(msg)
+        if "id" not in msg:
+            # Not the reply to our request, give the server a moment
+            await asyncio.sleep(0.5)
+        return True
 
     async def websocket_subscribe(self) -> None:
         """Send subscription for device updates."""
         LOGGER.debug("Websocket subscribing to notifications for %s", self._device_id)
-        subscribe = {
-            "jsonrpc": "2.0",
-            "id": 3,
-            "method": "wskSubscribe",
-            "params": {"topic": self._device_id + ".wskAttributeUpdateNtfy"},
-        }
-        await self.websocket_send(subscribe)
+        await self._send_frame(self._subscribe_frame)
 
     async def websocket_send(self, message: dict) -> bool:
         """Send websocket message."""
-        json_message = json.dumps(message)
-        LOGGER.debug("Websocket sending data: %s", self.redact_api_key(message))
+        json_message = json_dumps(message)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Websocket sending data: %r", self.redact_api_key(message))
+        return await self._send_frame(json_message)
 
+    async def _send_frame(self, json_message: str) -> bool:
+        """Send a serialized message over the websocket."""
         try:
             await self._ws_client.send_str(json_message)
             LOGGER.debug("Websocket message sent.")
@@ -612,15 +772,15 @@ class RyobiWebSocket:
         except Exception as err:
             LOGGER.error("Websocket error sending message: %s", err)
             self._error_reason = err
-            await RyobiWebSocket.state.fset(self, STATE_DISCONNECTED)
+            await self._set_state(STATE_DISCONNECTED)
         return False
 
     def redact_api_key(self, message: dict) -> dict:
-        """Clear API key data from logs."""
-        if "params" in message:
-            if "apiKey" in message["params"]:
-                message["params"]["apiKey"] = ""
-        return json.dumps(message)
+        """Return a copy of message with the API key cleared for logging."""
+        params = message.get("params")
+        if params is None or "apiKey" not in params:
+            return message
+        return {**message, "params": {**params, "apiKey": "***"}}
 
     async def send_message(self, *args):
         """Send message to API."""
@@ -628,27 +788,24 @@ class RyobiWebSocket:
             LOGGER.warning("Websocket not yet connected, unable to send command.")
             return
 
-        LOGGER.debug("Send message args: %s", args)
+        debug = LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            LOGGER.debug("Send message args: %r", args)
 
-        ws_command = {
-            "jsonrpc": "2.0",
-            "method": "gdoModuleCommand",
-            "params": {
-                "msgType": 16,
-                "moduleType": int(args[1]),
-                "portId": int(args[0]),
-                "moduleMsg": {args[2]: args[3]},
-                "topic": self._device_id,
-            },
-        }
-        LOGGER.debug(
-            "Sending command: %s value: %s portId: %s moduleType: %s",
-            args[2],
-            args[3],
-            args[0],
-            args[1],
-        )
-        LOGGER.debug("Full message: %s", ws_command)
+        ws_command = self._cmd_template
+        params = ws_command["params"]
+        params["moduleType"] = int(args[1])
+        params["portId"] = int(args[0])
+        params["moduleMsg"] = {args[2]: args[3]}
+        if debug:
+            LOGGER.debug(
+                "Sending command: %s value: %s portId: %s moduleType: %s",
+                args[2],
+                args[3],
+                args[0],
+                args[1],
+            )
+            LOGGER.debug("Full message: %r", ws_command)
         await self.websocket_send(ws_command)
 
 
@@ -9,74 +9,93 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_DEVICE_ID, COORDINATOR, DOMAIN
+from .const import CONF_DEVICE_ID, COORDINATOR, DOMAIN, LOGGER
 
-LOGGER = logging.getLogger(__name__)
-
-BINARY_SENSORS: Final[dict[str, BinarySensorEntityDescription]] = {
-    "park_assist": BinarySensorEntityDescription(
+BINARY_SENSORS: Final[tuple[BinarySensorEntityDescription, ...]] = (
+    BinarySensorEntityDescription(
         name="Park Assist",
         icon="mdi:parking",
         key="park_assist",
     ),
-    "inflator": BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         name="Inflator",
         icon="mdi:car-tire-alert",
         key="inflator",
         entity_registry_enabled_default=False,
     ),
-    "motion": BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         name="Motion",
         key="motion",
         device_class=BinarySensorDeviceClass.MOTION,
         entity_registry_enabled_default=False,
     ),
-    "vacationMode": BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         name="Vacation Mode",
         key="vacationMode",
         icon="mdi:wallet-travel",
         entity_registry_enabled_default=False,
     ),
-    "sensorFlag": BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         name="Safety Sensor",
         key="saftey",
         icon="mdi:laser-pointer",
         entity_registry_enabled_default=False,
     ),
-    "btSpeaker": BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         name="Bluetooth Speaker",
         key="bt_speaker",
         icon="mdi:speaker",
         entity_registry_enabled_default=False,
     ),
-    "micStatus": BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         name="Microphone",
         key="micStatus",
         icon="mdi:microphone",
         entity_registry_enabled_default=False,
     ),
-    "websocket": BinarySensorEntityDescription(
+    BinarySensorEntityDescription(
         name="Server Connection",
         key="websocket",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
     ),
-}
+)
+
+
+def _unique_id(name: str, device_id: str) -> str:
+    """Return the unique id of a binary sensor."""
+    return f"ryobi_gdo_{name}_{device_id}"
 
 
 async def async_setup_entry(hass, entry, async_add_devices):
     """Define the binary_sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
 
-    binary_sensors = []
-    for binary_sensor in BINARY_SENSORS:
-        binary_sensors.append(
-            RyobiBinarySensor(BINARY_SENSORS[binary_sensor], entry, coordinator)
-        )
+    registry = er.async_get(hass)
+    device_id = entry.data[CONF_DEVICE_ID]
+    device_name = coordinator.data["device_name"]
 
-    async_add_devices(binary_sensors, False)
+    def _is_disabled(description: BinarySensorEntityDescription) -> bool:
+        """Return True if the user has disabled this sensor."""
+        entity_id = registry.async_get_entity_id(
+            "binary_sensor", DOMAIN, _unique_id(description.name, device_id)
+        )
+        # Sensors not registered yet still have to be created once so they
+        # show up in the registry and can be enabled by the user
+        if entity_id is None:
+            return False
+        return registry.async_get(entity_id).disabled
+
+    async_add_devices(
+        [
+            RyobiBinarySensor(description, entry, coordinator, device_name)
+            for description in BINARY_SENSORS
+            if not _is_disabled(description)
+        ],
+        False,
+    )
 
 
 class RyobiBinarySensor(CoordinatorEntity, BinarySensorEntity):
@@ -87,48 +106,38 @@ class RyobiBinarySensor(CoordinatorEntity, BinarySensorEntity):
         sensor_description: BinarySensorEntityDescription,
         config_entry: ConfigEntry,
         coordinator: str,
+        device_name: str,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._config = config_entry
         self.entity_description = sensor_description
+        self._attr_icon = sensor_description.icon
+        self._attr_device_info = coordinator.device_info
         self._name = sensor_description.name
         self._key = sensor_description.key
+        self._is_websocket = sensor_description.key == "websocket"
         self.device_id = config_entry.data[CONF_DEVICE_ID]
 
-        self._attr_name = f"{coordinator.data['device_name']} {self._name}"
-        self._attr_unique_id = f"ryobi_gdo_{self._name}_{self.device_id}"
+        self._attr_name = f"{device_name} {self._name}"
+        self._attr_unique_id = _unique_id(self._name, self.device_id)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        if self._key == "websocket":
+        if self._is_websocket:
             return True  # This sensor should always be available
-        return True if self._key in self.coordinator.data else False
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return self.entity_description.icon
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.device_id)},
-            manufacturer="Ryobi",
-            model="GDO",
-            name="Ryobi Garage Door Opener",
-        )
+        return self._key in self.coordinator.data
 
     @property
     def is_on(self) -> bool:
         """Return True if the service is on."""
-        data = self.coordinator.data
-        if self._key == "websocket":
+        if self._is_websocket:
             return self.coordinator.client.ws_listening
+        data = self.coordinator.data
         if self._key not in data:
             LOGGER.info("binary_sensor [%s] not supported.", self._key)
             return None
-        LOGGER.debug("binary_sensor [%s]: %s", self._name, data[self._key])
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("binary_sensor [%s]: %s", self._name, data[self._key])
         return cast(bool, data[self._key] == 1)
@@ -7,6 +7,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.helpers import selector
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import RyobiApiClient
 from .const import CONF_DEVICE_ID, DOMAIN
@@ -21,6 +22,7 @@ class RyobiFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize."""
         self._data = {}
+        self._devices: dict[str, str] = {}
 
     async def async_step_user(
         self,
@@ -73,9 +75,6 @@ class RyobiFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 title=self._data[CONF_USERNAME],
                 data=self._data,
             )
-        device_list = await self._get_device_ids(
-            self._data[CONF_USERNAME], self._data[CONF_PASSWORD]
-        )
         return self.async_show_form(
             step_id="user_2",
             data_schema=vol.Schema(
@@ -83,7 +82,7 @@ class RyobiFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Required(
                         CONF_DEVICE_ID,
                         default=(user_input or {}).get(CONF_DEVICE_ID),
-                    ): vol.In(device_list),
+                    ): vol.In(self._devices),
                 }
             ),
             errors=errors,
@@ -91,14 +90,16 @@ class RyobiFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_credentials(self, username: str, password: str) -> bool:
         """Validate credentials and retrieve device IDs."""
-        client = RyobiApiClient(username=username, password=password)
+        client = RyobiApiClient(
+            username=username,
+            password=password,
+            session=async_get_clientsession(self.hass),
+        )
 
         # Validate credentials
-        return await client.get_api_key()
-
-    async def _get_device_ids(self, username: str, password: str) -> list:
-        """Return list of device IDs."""
-        client = RyobiApiClient(username=username, password=password)
+        if not await client.get_api_key():
+            return False
 
-        # Get the devices associated with account
-        return await client.get_devices()
+        # Prefetch the devices so the next step renders without a round-trip
+        self._devices = await client.get_devices()
+        return True
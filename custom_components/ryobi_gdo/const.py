@@ -1,12 +1,16 @@
 """Constants for ryobi_gdo."""
 
+import logging
+
+LOGGER = logging.getLogger(__package__)
+
 NAME = "Ryobi GDO"
 DOMAIN = "ryobi_gdo"
 VERSION = "0.1.1"
 ATTRIBUTION = "Data provided by Ryobi"
 ISSUE_URL = "https://github.com/catduckgnaf/ryobi_gdo/issues"
 
-PLATFORMS = ["cover", "switch", "sensor", "binary_sensor"]
+PLATFORMS = ("binary_sensor", "cover", "sensor", "switch")
 
 HOST_URI = "tti.tiwiconnect.com"
 LOGIN_ENDPOINT = "api/login"
@@ -3,17 +3,25 @@
 from __future__ import annotations
 
 from datetime import timedelta
-import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import RyobiApiClient
-from .const import CONF_DEVICE_ID, COORDINATOR, DOMAIN
+from .const import CONF_DEVICE_ID, DOMAIN, LOGGER
 
-LOGGER = logging.getLogger(__name__)
+# Ryobi pushes something over the websocket about every 5 minutes
+WS_LIVENESS_WINDOW = 5 * 60
+
+# Polling tiers
+TIER_ACTIVE = "active"
+TIER_NORMAL = "normal"
+TIER_IDLE = "idle"
 
 
 class RyobiDataUpdateCoordinator(DataUpdateCoordinator):
@@ -25,26 +33,69 @@ class RyobiDataUpdateCoordinator(DataUpdateCoordinator):
         self.name = f"Ryobi GDO ({config.data.get(CONF_DEVICE_ID)})"
         self.config = config
         self.hass = hass
-        self._data = {}
+        self._tier = TIER_NORMAL
+        # Shared by every entity of this device
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, config.data[CONF_DEVICE_ID])},
+            manufacturer="Ryobi",
+            model="GDO",
+            name="Ryobi Garage Door Opener",
+        )
         self.client = RyobiApiClient(
             config.data.get(CONF_USERNAME),
             config.data.get(CONF_PASSWORD),
             config.data.get(CONF_DEVICE_ID),
+            session=async_get_clientsession(hass),
         )
-        self.client.callback = self.websocket_update
+        self.client.callback = self._on_ws_frame
 
         LOGGER.debug("Data will be update every %s", self.interval)
 
-        super().__init__(hass, LOGGER, name=self.name, update_interval=self.interval)
+        super().__init__(
+            hass,
+            LOGGER,
+            name=self.name,
+            update_interval=self.interval,
+            always_update=False,
+        )
 
     async def _async_update_data(self):
         """Return data."""
         result = await self.client.update()
         if result:
-            self._data = self.client._data
-            return self._data
+            self._adjust_update_interval()
+            return self._snapshot()
         raise UpdateFailed()
 
+    def _adjust_update_interval(self) -> None:
+        """Poll less while the websocket is pushing updates, more when it is down."""
+        ws = self.client.ws
+        if not self.client.ws_listening:
+            tier = TIER_ACTIVE
+        elif (
+            ws is not None
+            and ws.last_msg is not None
+            and time.time() - ws.last_msg < WS_LIVENESS_WINDOW
+        ):
+            tier = TIER_IDLE
+        else:
+            tier = TIER_NORMAL
+
+        if tier == self._tier:
+            return
+        self._tier = tier
+
+        seconds = self.interval.total_seconds()
+        if tier == TIER_ACTIVE:
+            self.update_interval = timedelta(seconds=max(5, seconds // 3))
+        elif tier == TIER_IDLE:
+            self.update_interval = timedelta(seconds=seconds * 4)
+        else:
+            self.update_interval = self.interval
+        LOGGER.debug(
+            "Polling tier %s, data will be update every %s", tier, self.update_interval
+        )
+
     async def send_command(self, device: str, command: str, value: bool):
         """Send command to GDO."""
         await self._websocket_check()
@@ -55,15 +106,29 @@ class RyobiDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _websocket_check(self):
         """Handle reconnection of websocket."""
+        if self.client.ws_running:
+            return
         if not self.client.ws_listening:
             # Reconnect the websocket
-            await self.client.ws_connect()
+            self.client.ws_connect()
+
+    def _snapshot(self) -> dict:
+        """Return a copy of the client data including the connection state."""
+        # The client updates its dict in place, hand out a snapshot so
+        # unchanged polls compare equal and skip the listener writes. The
+        # connection state is part of it since entity availability and the
+        # connection sensor depend on it.
+        return {**self.client._data, "ws_listening": self.client.ws_listening}
 
     @callback
-    async def websocket_update(self):
-        """Trigger processing updated websocket data."""
-        LOGGER.debug("Processing websocket data.")
-        await self._websocket_check()
-        self._data = self.client._data
-        coordinator = self.hass.data[DOMAIN][self.config.entry_id][COORDINATOR]
-        coordinator.async_set_updated_data(self._data)
+    def _on_ws_frame(self):
+        """Push data updated by the websocket to listeners."""
+        # Connection changes arrive here too, switch tiers before the next
+        # poll gets scheduled
+        self._adjust_update_interval()
+        data = self._snapshot()
+        # async_set_updated_data always notifies listeners, skip frames that
+        # did not change anything
+        if data == self.data:
+            return
+        self.async_set_updated_data(data)
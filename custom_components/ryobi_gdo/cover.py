@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import logging
 from typing import Final
 
 from homeassistant.components.cover import (
@@ -13,12 +12,9 @@ from homeassistant.components.cover import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_CLOSED, STATE_CLOSING, STATE_OPENING
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_DEVICE_ID, COORDINATOR, DOMAIN
-
-LOGGER = logging.getLogger(__name__)
+from .const import CONF_DEVICE_ID, COORDINATOR, DOMAIN, LOGGER
 
 COVER_TYPES: Final[dict[str, CoverEntityDescription]] = {
     "garage_door": CoverEntityDescription(
@@ -35,11 +31,13 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the cover entities."""
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
 
-    covers = []
-    for cover in COVER_TYPES:  # pylint: disable=consider-using-dict-items
-        covers.append(RyobiCover(COVER_TYPES[cover], coordinator, entry))
-
-    async_add_entities(covers, False)
+    async_add_entities(
+        [
+            RyobiCover(description, coordinator, entry)
+            for description in COVER_TYPES.values()
+        ],
+        False,
+    )
 
 
 class RyobiCover(CoordinatorEntity, CoverEntity):
@@ -57,45 +55,35 @@ class RyobiCover(CoordinatorEntity, CoverEntity):
         self.coordinator = coordinator
         self.entity_description = sensor_description
         self._name = sensor_description.name
+        self._key = sensor_description.key
         self.device_id = config_entry.data[CONF_DEVICE_ID]
-        self._attr_name = f"{coordinator.data['device_name']} {self._name}"
+        self._attr_name = self._name
         self._attr_unique_id = f"ryobi_gdo_{self._name}_{self.device_id}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.device_id)},
-            manufacturer="Ryobi",
-            model="GDO",
-            name="Ryobi Garage Door Opener",
-        )
-
-    @property
-    def name(self):
-        """Return the name of the cover."""
-        return self._name
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_opening(self) -> bool | None:
         """Return if the cover is opening or not."""
-        if self.coordinator.data[self.entity_description.key] is None:
+        state = self.coordinator.data.get(self._key)
+        if state is None:
             return None
-        return bool(self.coordinator.data[self.entity_description.key] == STATE_OPENING)
+        return state == STATE_OPENING
 
     @property
     def is_closing(self) -> bool | None:
         """Return if the cover is closing or not."""
-        if self.coordinator.data[self.entity_description.key] is None:
+        state = self.coordinator.data.get(self._key)
+        if state is None:
             return None
-        return bool(self.coordinator.data[self.entity_description.key] == STATE_CLOSING)
+        return state == STATE_CLOSING
 
     @property
     def is_closed(self) -> bool | None:
         """Return if the cover is closed or not."""
-        if self.coordinator.data[self.entity_description.key] is None:
+        state = self.coordinator.data.get(self._key)
+        if state is None:
             return None
-        return bool(self.coordinator.data[self.entity_description.key] == STATE_CLOSED)
+        return state == STATE_CLOSED
 
     @property
     def supported_features(self):
@@ -106,11 +94,13 @@ class RyobiCover(CoordinatorEntity, CoverEntity):
         """Close the cover."""
         LOGGER.debug("Closing garage door")
         await self.coordinator.send_command("garageDoor", "doorCommand", 0)
+        await self.coordinator.async_request_refresh()
 
     async def async_open_cover(self, **kwargs):
         """Open the cover."""
         LOGGER.debug("Opening garage door")
         await self.coordinator.send_command("garageDoor", "doorCommand", 1)
+        await self.coordinator.async_request_refresh()
 
     @property
     def should_poll(self) -> bool:
@@ -120,10 +110,7 @@ class RyobiCover(CoordinatorEntity, CoverEntity):
     @property
     def extra_state_attributes(self) -> dict | None:
         """Return sesnsor attributes."""
-        attrs = {}
-        if "door_attributes" in self.coordinator.data:
-            attrs.update(self.coordinator.data["door_attributes"])
-        return attrs
+        return self.coordinator.data.get("door_attributes")
 
     @property
     def available(self) -> bool:
@@ -12,7 +12,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import PERCENTAGE, SIGNAL_STRENGTH_DECIBELS
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import ATTR_ATTRIBUTION, ATTRIBUTION, CONF_DEVICE_ID, COORDINATOR, DOMAIN
@@ -40,11 +40,13 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the Ryobi GDO sensors."""
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
 
-    sensors = []
-    for sensor in SENSOR_TYPES:  # pylint: disable=consider-using-dict-items
-        sensors.append(RyobiSensor(SENSOR_TYPES[sensor], coordinator, entry))
-
-    async_add_entities(sensors, False)
+    async_add_entities(
+        [
+            RyobiSensor(description, coordinator, entry)
+            for description in SENSOR_TYPES.values()
+        ],
+        False,
+    )
 
 
 class RyobiSensor(CoordinatorEntity, SensorEntity):
@@ -61,40 +63,26 @@ class RyobiSensor(CoordinatorEntity, SensorEntity):
         self._config = config_entry
         self.entity_description = sensor_description
         self._name = sensor_description.name
+        self._key = sensor_description.key
         self.device_id = config_entry.data[CONF_DEVICE_ID]
         self._attr_name = f"{coordinator.data['device_name']} {self._name}"
         self._attr_unique_id = f"ryobi_gdo_{self._name}_{self.device_id}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.device_id)},
-            manufacturer="Ryobi",
-            model="GDO",
-            name="Ryobi Garage Door Opener",
-        )
+        self._attr_icon = sensor_description.icon
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
-        return self.coordinator.data[self.entity_description.key]
-
-    @property
-    def icon(self) -> str:
-        """Return the icon."""
-        return self.entity_description.icon
+        return self.coordinator.data.get(self._key)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        data = self.coordinator.data
-        if self.entity_description.key not in data or (
-            self.entity_description.key in data
-            and data[self.entity_description.key] is None
-        ):
-            return False
-        return self.coordinator.last_update_success
+        coordinator = self.coordinator
+        return (
+            coordinator.data.get(self._key) is not None
+            and coordinator.last_update_success
+        )
 
     @property
     def should_poll(self) -> bool:
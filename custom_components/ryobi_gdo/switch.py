@@ -1,16 +1,12 @@
 """Ryobi platform for the switch component."""
 
-import logging
-from typing import Any, cast, Final
+from typing import Any, Final
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_DEVICE_ID, COORDINATOR, DOMAIN
-
-LOGGER = logging.getLogger(__name__)
+from .const import CONF_DEVICE_ID, COORDINATOR, DOMAIN, LOGGER
 
 SWITCH_TYPES: Final[dict[str, SwitchEntityDescription]] = {
     "light": SwitchEntityDescription(
@@ -29,11 +25,13 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the OpenEVSE switches."""
     coordinator = hass.data[DOMAIN][entry.entry_id][COORDINATOR]
 
-    switches = []
-    for switch in SWITCH_TYPES:
-        switches.append(RyobiSwitch(hass, entry, coordinator, SWITCH_TYPES[switch]))
-
-    async_add_entities(switches, False)
+    async_add_entities(
+        [
+            RyobiSwitch(hass, entry, coordinator, description)
+            for description in SWITCH_TYPES.values()
+        ],
+        False,
+    )
 
 
 class RyobiSwitch(CoordinatorEntity, SwitchEntity):
@@ -53,21 +51,7 @@ class RyobiSwitch(CoordinatorEntity, SwitchEntity):
         self._type = description.key
         self._attr_name = f"{coordinator.data['device_name']} {description.name}"
         self._attr_unique_id = f"ryobi_gdo_{description.name}_{self.device_id}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device registry information for this entity."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.device_id)},
-            manufacturer="Ryobi",
-            model="GDO",
-            name="Ryobi Garage Door Opener",
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return self._attr_name
+        self._attr_device_info = coordinator.device_info
 
     @property
     def available(self) -> bool:
@@ -77,10 +61,10 @@ class RyobiSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return if the light is off."""
-        data = self.coordinator._data
-        if self._type not in data:
+        data = self.coordinator.data
+        if data is None:
             return False
-        return cast(bool, data[self._type] == 1)
+        return data.get(self._type) == 1
 
     async def async_turn_off(self, **kwargs: dict[str, Any]):
         """Turn off light."""
@@ -90,7 +74,7 @@ class RyobiSwitch(CoordinatorEntity, SwitchEntity):
         elif self._type == "inflator":
             LOGGER.debug("Turning off inflator")
             await self.coordinator.send_command("inflator", "moduleState", False)
-            await self.coordinator._async_update_data()
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_on(self, **kwargs: dict[str, Any]):
         """Turn on light."""
@@ -100,13 +84,11 @@ class RyobiSwitch(CoordinatorEntity, SwitchEntity):
         elif self._type == "inflator":
             LOGGER.debug("Turning on inflator")
             await self.coordinator.send_command("inflator", "moduleState", True)
-            await self.coordinator._async_update_data()
+        await self.coordinator.async_request_refresh()
 
     @property
     def extra_state_attributes(self) -> dict | None:
         """Return sesnsor attributes."""
-        attrs = {}
         if self._type == "light_state":
-            if "light_attributes" in self.coordinator.data:
-                attrs.update(self.coordinator.data["light_attributes"])
-        return attrs
+            return self.coordinator.data.get("light_attributes")
+        return None